@@ -10,7 +10,10 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import json
+import orjson
+import pyarrow.parquet as pq
 from pathlib import Path
+from table_io import read_table
 
 # Page configuration
 st.set_page_config(
@@ -34,39 +37,232 @@ page = st.sidebar.radio(
     ["Overview", "Data Comparison", "Quality Metrics", "Business Case"]
 )
 
-# Load data function
+# Data files; read_table falls back to the .csv file when the .parquet is missing
+REAL_FEATURES_PATH = 'data/raw/secom_features_clean.parquet'
+REAL_LABELS_PATH = 'data/raw/secom_labels_clean.parquet'
+SYNTHETIC_FEATURES_PATH = 'data/synthetic/features_synthetic_secom_gaussian.parquet'
+SYNTHETIC_LABELS_PATH = 'data/synthetic/labels_synthetic_secom_gaussian.parquet'
+EVALUATION_RESULTS_PATH = 'results/metrics/evaluation_results.json'
+
 @st.cache_data
-def load_data():
-    """Load real and synthetic data"""
+def column_names(path):
+    """Column names of a table, read from Parquet metadata or the CSV header"""
+    path = Path(path)
     try:
-        # Real data
-        X_real = pd.read_csv('data/raw/secom_features_clean.csv')
-        y_real = pd.read_csv('data/raw/secom_labels_clean.csv')
-        real_data = X_real.copy()
-        real_data['target'] = y_real.values
-        
-        # Synthetic data
-        X_synthetic = pd.read_csv('data/synthetic/features_synthetic_secom_gaussian.csv')
-        y_synthetic = pd.read_csv('data/synthetic/labels_synthetic_secom_gaussian.csv')
-        synthetic_data = X_synthetic.copy()
-        synthetic_data['target'] = y_synthetic.values
-        
-        return real_data, synthetic_data, True
-    except:
-        return None, None, False
+        return pq.read_schema(path.with_suffix('.parquet')).names
+    except FileNotFoundError:
+        return list(pd.read_csv(path.with_suffix('.csv'), nrows=0).columns)
 
 @st.cache_data
+def read_feature(path, feature):
+    """Values of a single feature column, without reading the other columns"""
+    return read_table(path, dtype='float32', columns=[feature])[feature].to_numpy()
+
+def load_feature_names():
+    """Real-data feature names, recording the reason for any failure"""
+    try:
+        # Touch every file the page reads so a missing one is reported up front
+        for path in (SYNTHETIC_FEATURES_PATH, REAL_LABELS_PATH, SYNTHETIC_LABELS_PATH):
+            column_names(path)
+        return column_names(REAL_FEATURES_PATH)
+    except (FileNotFoundError, pd.errors.ParserError) as e:
+        st.session_state["load_error"] = str(e)
+        return None
+
+@st.cache_data
+def describe_feature(path, feature):
+    """Summary statistics of a single feature column"""
+    return pd.Series(read_feature(path, feature)).describe(percentiles=[.25, .5, .75])
+
+@st.cache_data
+def target_summary(labels_path):
+    """Pass count, fail count and failure rate of a labels table"""
+    target = read_table(labels_path, dtype='int8')['target'].to_numpy()
+    fail_count = int((target == 1).sum())
+    pass_count = len(target) - fail_count
+    return pass_count, fail_count, fail_count / len(target)
+
+def load_dataset_summary():
+    """Real and synthetic row counts, feature count and real failure rate, or None"""
+    feature_names = load_feature_names()
+    if feature_names is None:
+        return None
+    try:
+        real_pass, real_fail, failure_rate = target_summary(REAL_LABELS_PATH)
+        synthetic_pass, synthetic_fail, _ = target_summary(SYNTHETIC_LABELS_PATH)
+    except (FileNotFoundError, pd.errors.ParserError) as e:
+        st.session_state["load_error"] = str(e)
+        return None
+    return real_pass + real_fail, synthetic_pass + synthetic_fail, len(feature_names), failure_rate
+
+@st.cache_resource
+def read_evaluation_results(mtime):
+    """Read evaluation results; mtime keys the cache so a rewritten file is reloaded"""
+    data = Path(EVALUATION_RESULTS_PATH).read_bytes()
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        # Files from older evaluator runs (json.dump) hold bare NaN, which orjson
+        # rejects; read those values as null, as current runs store them
+        return json.loads(data, parse_constant=lambda constant: None)
+
 def load_evaluation_results():
-    """Load evaluation results"""
+    """Load evaluation results, recording the reason for any failure"""
     try:
-        with open('results/metrics/evaluation_results.json', 'r') as f:
-            return json.load(f)
-    except:
+        return read_evaluation_results(Path(EVALUATION_RESULTS_PATH).stat().st_mtime)
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        st.session_state["load_error"] = str(e)
         return None
 
-# Load data
-real_data, synthetic_data, data_loaded = load_data()
-eval_results = load_evaluation_results()
+# Figure builders
+# Arguments are plain tuples/scalars so Streamlit can hash them cheaply, and
+# the figures are shared across reruns, so callers must not modify them
+@st.cache_resource
+def build_distribution_figure(feature_name, real_counts, synthetic_counts, edges):
+    """Overlaid histogram of pre-binned real and synthetic counts"""
+    edges = np.asarray(edges)
+    centers = (edges[:-1] + edges[1:]) / 2
+    widths = np.diff(edges)
+    
+    fig = go.Figure()
+    
+    # Real data histogram
+    fig.add_trace(go.Bar(
+        x=centers,
+        y=list(real_counts),
+        width=widths,
+        name="Real Data",
+        opacity=0.7,
+        marker_color='#1f77b4'
+    ))
+    
+    # Synthetic data histogram
+    fig.add_trace(go.Bar(
+        x=centers,
+        y=list(synthetic_counts),
+        width=widths,
+        name="Synthetic Data",
+        opacity=0.7,
+        marker_color='#ff7f0e'
+    ))
+    
+    fig.update_layout(
+        barmode='overlay',
+        xaxis_title=feature_name,
+        yaxis_title="Frequency",
+        height=400
+    )
+    
+    return fig
+
+def format_metric(value, spec, suffix=""):
+    """Format a saved metric; non-finite values are stored as null and shown as n/a"""
+    return "n/a" if value is None else f"{value:{spec}}{suffix}"
+
+# Log-spaced bins below 0.01, where KS p-values pile up, and linear bins above
+PVALUE_BIN_EDGES = np.concatenate([np.logspace(-10, -2, 20), np.linspace(0.01, 1, 20)[1:]])
+
+@st.cache_resource
+def build_pvalue_figure(ks_pvalues):
+    """Histogram of per-feature KS test p-values on a log10 axis"""
+    # Features without a p-value (saved as null) are left out of the histogram
+    pvalues = np.array(ks_pvalues, dtype=float)
+    pvalues = np.clip(pvalues[~np.isnan(pvalues)], PVALUE_BIN_EDGES[0], PVALUE_BIN_EDGES[-1])
+    counts, _ = np.histogram(pvalues, PVALUE_BIN_EDGES)
+    
+    # Plot in log10 space and divide by bin width so bars show features per decade
+    log_edges = np.log10(PVALUE_BIN_EDGES)
+    log_widths = np.diff(log_edges)
+    
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=(log_edges[:-1] + log_edges[1:]) / 2,
+        y=counts / log_widths,
+        width=log_widths,
+        customdata=counts,
+        hovertemplate="Features in bin: %{customdata}<extra></extra>",
+        marker_color='#3498db'
+    ))
+    fig.add_vline(x=np.log10(0.05), line_dash="dash", line_color="red",
+                  annotation_text="Significance threshold (p=0.05)")
+    fig.update_layout(
+        xaxis_title="P-value",
+        xaxis_tickvals=list(range(-10, 1, 2)),
+        xaxis_ticktext=[f"1e{e}" if e else "1" for e in range(-10, 1, 2)],
+        yaxis_title="Features per decade",
+        height=400
+    )
+    return fig
+
+@st.cache_resource
+def build_f1_figure(f1_real, f1_synthetic):
+    """Bar chart comparing F1 scores of the two training scenarios"""
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=['Train on Real → Test on Real', 'Train on Synthetic → Test on Real'],
+        y=[f1_real, f1_synthetic],
+        marker_color=['#3498db', '#e67e22'],
+        text=[format_metric(f1_real, ".3f"), format_metric(f1_synthetic, ".3f")],
+        textposition='auto'
+    ))
+    fig.update_layout(
+        yaxis_title="F1-Score",
+        height=400,
+        yaxis_range=[0, 1]
+    )
+    return fig
+
+@st.cache_resource
+def business_tables():
+    """Static Business Case tables: value drivers, roadmap and risks"""
+    benefits_df = pd.DataFrame({
+        'Benefit': [
+            'Yield Improvement (2-3%)',
+            'Faster Time-to-Market',
+            'Vendor Partnerships Enabled',
+            'Reduced Downtime',
+            'Cross-Facility Learning'
+        ],
+        'Annual Value (€M)': [12, 30, 8, 5, 10],
+        'Implementation Timeline': [
+            '6-12 months',
+            '3-6 months',
+            'Immediate',
+            '6-9 months',
+            '9-12 months'
+        ]
+    })
+    
+    roadmap_df = pd.DataFrame({
+        'Phase': ['Pilot', 'Validation', 'Scale', 'Enterprise'],
+        'Timeline': ['Month 1-2', 'Month 3-4', 'Month 5-8', 'Month 9-12'],
+        'Scope': [
+            'Single production line, 1 use case',
+            'Verify quality & privacy metrics',
+            'Expand to 3 lines, multiple use cases',
+            'Full deployment, vendor integration'
+        ],
+        'Investment': ['€200K', '€300K', '€800K', '€700K']
+    })
+    
+    risks_df = pd.DataFrame({
+        'Risk': [
+            'Synthetic data quality insufficient',
+            'Privacy concerns from stakeholders',
+            'Integration complexity',
+            'Change management resistance'
+        ],
+        'Mitigation Strategy': [
+            'Pilot validation phase with strict quality gates',
+            'Third-party privacy audit, transparent metrics',
+            'Phased rollout, dedicated integration team',
+            'Executive sponsorship, training program'
+        ],
+        'Probability': ['Low', 'Medium', 'Medium', 'Low'],
+        'Impact': ['High', 'High', 'Medium', 'Medium']
+    })
+    
+    return benefits_df, roadmap_df, risks_df
 
 # Overview Page
 if page == "Overview":
@@ -106,19 +302,21 @@ if page == "Overview":
         5. **Business Value**: Quantify ROI and implementation path
         """)
         
-        if data_loaded:
+        # Counts come from the label tables and column metadata, not the feature values
+        summary = load_dataset_summary()
+        if summary is not None:
+            n_real, n_synthetic, n_features, failure_rate = summary
             st.subheader("📈 Dataset Statistics")
             
             metrics_col1, metrics_col2, metrics_col3 = st.columns(3)
             
             with metrics_col1:
-                st.metric("Real Samples", f"{len(real_data):,}")
-                st.metric("Synthetic Samples", f"{len(synthetic_data):,}")
+                st.metric("Real Samples", f"{n_real:,}")
+                st.metric("Synthetic Samples", f"{n_synthetic:,}")
             
             with metrics_col2:
-                st.metric("Features", f"{len(real_data.columns)-1}")
-                failure_rate = (real_data['target'] == 1).mean() * 100
-                st.metric("Failure Rate", f"{failure_rate:.1f}%")
+                st.metric("Features", f"{n_features}")
+                st.metric("Failure Rate", f"{failure_rate * 100:.1f}%")
             
             with metrics_col3:
                 st.metric("Industry", "Semiconductor")
@@ -128,41 +326,40 @@ if page == "Overview":
 elif page == "Data Comparison":
     st.header("Real vs Synthetic Data Comparison")
     
-    if not data_loaded:
+    feature_cols = load_feature_names()
+    if feature_cols is None:
         st.error("⚠️ Data not loaded. Please run data_loader.py and synthetic_generator.py first.")
+        st.caption(st.session_state.get("load_error", ""))
     else:
         # Feature selection
-        feature_cols = [col for col in real_data.columns if col != 'target']
-        selected_feature = st.selectbox("Select Feature to Compare", feature_cols)
+        # A numeric index avoids sending every feature name to the browser on each rerun
+        feature_idx = st.number_input(
+            "Feature to Compare",
+            min_value=0,
+            max_value=len(feature_cols) - 1,
+            value=0,
+            step=1,
+            help=f"Index of the feature to compare (0-{len(feature_cols) - 1})"
+        )
+        selected_feature = feature_cols[int(feature_idx)]
         
         # Distribution comparison
         st.subheader(f"Distribution Comparison: {selected_feature}")
         
-        fig = go.Figure()
-        
-        # Real data histogram
-        fig.add_trace(go.Histogram(
-            x=real_data[selected_feature],
-            name="Real Data",
-            opacity=0.7,
-            marker_color='#1f77b4',
-            nbinsx=50
-        ))
-        
-        # Synthetic data histogram
-        fig.add_trace(go.Histogram(
-            x=synthetic_data[selected_feature],
-            name="Synthetic Data",
-            opacity=0.7,
-            marker_color='#ff7f0e',
-            nbinsx=50
-        ))
-        
-        fig.update_layout(
-            barmode='overlay',
-            xaxis_title=selected_feature,
-            yaxis_title="Frequency",
-            height=400
+        # Bin both datasets on shared edges so only 50 counts per trace reach the browser
+        # Only the selected column is read from each table
+        real_col = read_feature(REAL_FEATURES_PATH, selected_feature)
+        synthetic_col = read_feature(SYNTHETIC_FEATURES_PATH, selected_feature)
+        real_col = real_col[~np.isnan(real_col)]
+        synthetic_col = synthetic_col[~np.isnan(synthetic_col)]
+        edges = np.histogram_bin_edges(np.concatenate([real_col, synthetic_col]), bins=50)
+        real_counts, _ = np.histogram(real_col, edges)
+        synthetic_counts, _ = np.histogram(synthetic_col, edges)
+        fig = build_distribution_figure(
+            selected_feature,
+            tuple(real_counts.tolist()),
+            tuple(synthetic_counts.tolist()),
+            tuple(edges.tolist())
         )
         
         st.plotly_chart(fig, use_container_width=True)
@@ -172,13 +369,13 @@ elif page == "Data Comparison":
         
         with col1:
             st.subheader("Real Data Statistics")
-            real_stats = real_data[selected_feature].describe()
-            st.dataframe(real_stats)
+            real_stats = describe_feature(REAL_FEATURES_PATH, selected_feature)
+            st.table(real_stats.to_frame("value").style.format("{:.4f}"))
         
         with col2:
             st.subheader("Synthetic Data Statistics")
-            synthetic_stats = synthetic_data[selected_feature].describe()
-            st.dataframe(synthetic_stats)
+            synthetic_stats = describe_feature(SYNTHETIC_FEATURES_PATH, selected_feature)
+            st.table(synthetic_stats.to_frame("value").style.format("{:.4f}"))
         
         # Target distribution comparison
         st.subheader("Target Distribution Comparison")
@@ -186,9 +383,9 @@ elif page == "Data Comparison":
         col1, col2 = st.columns(2)
         
         with col1:
-            real_target_counts = real_data['target'].value_counts()
+            real_pass, real_fail, _ = target_summary(REAL_LABELS_PATH)
             fig_real = px.pie(
-                values=real_target_counts.values,
+                values=[real_pass, real_fail],
                 names=['Pass', 'Fail'],
                 title="Real Data Target Distribution",
                 color_discrete_sequence=['#2ecc71', '#e74c3c']
@@ -196,9 +393,9 @@ elif page == "Data Comparison":
             st.plotly_chart(fig_real, use_container_width=True)
         
         with col2:
-            synthetic_target_counts = synthetic_data['target'].value_counts()
+            synthetic_pass, synthetic_fail, _ = target_summary(SYNTHETIC_LABELS_PATH)
             fig_synthetic = px.pie(
-                values=synthetic_target_counts.values,
+                values=[synthetic_pass, synthetic_fail],
                 names=['Pass', 'Fail'],
                 title="Synthetic Data Target Distribution",
                 color_discrete_sequence=['#2ecc71', '#e74c3c']
@@ -209,8 +406,10 @@ elif page == "Data Comparison":
 elif page == "Quality Metrics":
     st.header("Synthetic Data Quality Evaluation")
     
+    eval_results = load_evaluation_results()
     if eval_results is None:
         st.warning("⚠️ Evaluation results not found. Please run evaluator.py first.")
+        st.caption(st.session_state.get("load_error", ""))
         
         st.markdown("""
         ### Expected Quality Metrics
@@ -232,7 +431,7 @@ elif page == "Quality Metrics":
             stat_sim = eval_results['statistical_similarity']['pct_similar_features']
             st.metric(
                 "Statistical Similarity",
-                f"{stat_sim:.1f}%",
+                format_metric(stat_sim, ".1f", "%"),
                 help="% of features with similar distributions (KS test p>0.05)"
             )
         
@@ -240,7 +439,7 @@ elif page == "Quality Metrics":
             corr_pres = eval_results['correlation_preservation']['r_squared']
             st.metric(
                 "Correlation R²",
-                f"{corr_pres:.3f}",
+                format_metric(corr_pres, ".3f"),
                 help="R² between real and synthetic correlation matrices"
             )
         
@@ -248,7 +447,7 @@ elif page == "Quality Metrics":
             privacy = eval_results['privacy_metrics']['mean_dcr']
             st.metric(
                 "Privacy (DCR)",
-                f"{privacy:.2f}σ",
+                format_metric(privacy, ".2f", "σ"),
                 help="Mean distance to closest real record (in std units)"
             )
         
@@ -256,7 +455,7 @@ elif page == "Quality Metrics":
             ml_eff = eval_results['ml_efficacy']['f1_retention_pct']
             st.metric(
                 "ML Efficacy",
-                f"{ml_eff:.1f}%",
+                format_metric(ml_eff, ".1f", "%"),
                 help="% of ML performance retained"
             )
         
@@ -279,22 +478,10 @@ elif page == "Quality Metrics":
             
             ks_pvalues = eval_results['statistical_similarity']['ks_pvalues']
             
-            fig = go.Figure()
-            fig.add_trace(go.Histogram(
-                x=ks_pvalues,
-                nbinsx=50,
-                marker_color='#3498db'
-            ))
-            fig.add_vline(x=0.05, line_dash="dash", line_color="red",
-                         annotation_text="Significance threshold (p=0.05)")
-            fig.update_layout(
-                xaxis_title="P-value",
-                yaxis_title="Number of Features",
-                height=400
-            )
+            fig = build_pvalue_figure(tuple(ks_pvalues))
             st.plotly_chart(fig, use_container_width=True)
             
-            st.info(f"✓ {stat_sim:.1f}% of features pass the similarity test (p > 0.05)")
+            st.info(f"✓ {format_metric(stat_sim, '.1f', '%')} of features pass the similarity test (p > 0.05)")
         
         with tab2:
             st.markdown("### Correlation Structure Preservation")
@@ -306,10 +493,12 @@ elif page == "Quality Metrics":
             corr_value = eval_results['correlation_preservation']['correlation_of_correlations']
             r_squared = eval_results['correlation_preservation']['r_squared']
             
-            st.metric("Correlation of Correlations", f"{corr_value:.4f}")
-            st.metric("R² Score", f"{r_squared:.4f}")
+            st.metric("Correlation of Correlations", format_metric(corr_value, ".4f"))
+            st.metric("R² Score", format_metric(r_squared, ".4f"))
             
-            if r_squared > 0.9:
+            if r_squared is None:
+                st.info("R² could not be computed for this run")
+            elif r_squared > 0.9:
                 st.success("✓ Excellent correlation preservation!")
             elif r_squared > 0.7:
                 st.success("✓ Good correlation preservation")
@@ -328,11 +517,13 @@ elif page == "Quality Metrics":
             min_dcr = eval_results['privacy_metrics']['min_dcr']
             
             col1, col2, col3 = st.columns(3)
-            col1.metric("Mean DCR", f"{mean_dcr:.2f}σ")
-            col2.metric("Std Dev DCR", f"{std_dcr:.2f}σ")
-            col3.metric("Min DCR", f"{min_dcr:.2f}σ")
+            col1.metric("Mean DCR", format_metric(mean_dcr, ".2f", "σ"))
+            col2.metric("Std Dev DCR", format_metric(std_dcr, ".2f", "σ"))
+            col3.metric("Min DCR", format_metric(min_dcr, ".2f", "σ"))
             
-            if mean_dcr > 2.0:
+            if mean_dcr is None:
+                st.info("DCR could not be computed for this run")
+            elif mean_dcr > 2.0:
                 st.success("✓ Excellent privacy - synthetic records are well-separated from real data")
             elif mean_dcr > 1.0:
                 st.success("✓ Good privacy preservation")
@@ -351,24 +542,14 @@ elif page == "Quality Metrics":
             retention = eval_results['ml_efficacy']['f1_retention_pct']
             
             # Create comparison chart
-            fig = go.Figure()
-            fig.add_trace(go.Bar(
-                x=['Train on Real → Test on Real', 'Train on Synthetic → Test on Real'],
-                y=[f1_real, f1_synthetic],
-                marker_color=['#3498db', '#e67e22'],
-                text=[f"{f1_real:.3f}", f"{f1_synthetic:.3f}"],
-                textposition='auto'
-            ))
-            fig.update_layout(
-                yaxis_title="F1-Score",
-                height=400,
-                yaxis_range=[0, 1]
-            )
+            fig = build_f1_figure(f1_real, f1_synthetic)
             st.plotly_chart(fig, use_container_width=True)
             
-            st.metric("Performance Retention", f"{retention:.1f}%")
+            st.metric("Performance Retention", format_metric(retention, ".1f", "%"))
             
-            if retention > 95:
+            if retention is None:
+                st.info("Performance retention could not be computed for this run")
+            elif retention > 95:
                 st.success("✓ Excellent - synthetic data nearly matches real data performance")
             elif retention > 85:
                 st.success("✓ Good - synthetic data maintains strong predictive value")
@@ -406,25 +587,8 @@ elif page == "Business Case":
     # ROI metrics
     st.markdown("### Value Drivers")
     
-    benefits_df = pd.DataFrame({
-        'Benefit': [
-            'Yield Improvement (2-3%)',
-            'Faster Time-to-Market',
-            'Vendor Partnerships Enabled',
-            'Reduced Downtime',
-            'Cross-Facility Learning'
-        ],
-        'Annual Value (€M)': [12, 30, 8, 5, 10],
-        'Implementation Timeline': [
-            '6-12 months',
-            '3-6 months',
-            'Immediate',
-            '6-9 months',
-            '9-12 months'
-        ]
-    })
-    
-    st.dataframe(benefits_df, use_container_width=True)
+    benefits_df, roadmap_df, risks_df = business_tables()
+    st.table(benefits_df)
     
     # Financial summary
     st.markdown("### Financial Summary")
@@ -442,19 +606,7 @@ elif page == "Business Case":
     
     st.subheader("🚀 Implementation Roadmap")
     
-    roadmap_df = pd.DataFrame({
-        'Phase': ['Pilot', 'Validation', 'Scale', 'Enterprise'],
-        'Timeline': ['Month 1-2', 'Month 3-4', 'Month 5-8', 'Month 9-12'],
-        'Scope': [
-            'Single production line, 1 use case',
-            'Verify quality & privacy metrics',
-            'Expand to 3 lines, multiple use cases',
-            'Full deployment, vendor integration'
-        ],
-        'Investment': ['€200K', '€300K', '€800K', '€700K']
-    })
-    
-    st.dataframe(roadmap_df, use_container_width=True)
+    st.table(roadmap_df)
     
     st.subheader("🎯 Success Metrics")
     
@@ -480,24 +632,7 @@ elif page == "Business Case":
     
     st.subheader("⚠️ Risk Mitigation")
     
-    risks_df = pd.DataFrame({
-        'Risk': [
-            'Synthetic data quality insufficient',
-            'Privacy concerns from stakeholders',
-            'Integration complexity',
-            'Change management resistance'
-        ],
-        'Mitigation Strategy': [
-            'Pilot validation phase with strict quality gates',
-            'Third-party privacy audit, transparent metrics',
-            'Phased rollout, dedicated integration team',
-            'Executive sponsorship, training program'
-        ],
-        'Probability': ['Low', 'Medium', 'Medium', 'Low'],
-        'Impact': ['High', 'High', 'Medium', 'Medium']
-    })
-    
-    st.dataframe(risks_df, use_container_width=True)
+    st.table(risks_df)
 
 # Footer
 st.markdown("---")
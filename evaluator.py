@@ -7,36 +7,254 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 from scipy import stats
+import sklearn
 from sklearn.model_selection import train_test_split, cross_val_score
-from sklearn.ensemble import RandomForestClassifier
+from sklearn.ensemble import HistGradientBoostingClassifier
 from sklearn.metrics import classification_report, f1_score, roc_auc_score, confusion_matrix
 from sklearn.preprocessing import StandardScaler
 import pickle
-import json
+import orjson
+import hashlib
+import joblib
+import threading
+import io
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from table_io import read_table
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+try:
+    import faiss
+except ImportError:
+    faiss = None
+
+# Below this many values (real + synthetic) the numpy KS loop finishes before
+# the numba kernel is even loaded from its on-disk cache (~0.25 s per process)
+KS_NUMBA_MIN_VALUES = 2_000_000
+
+
+if numba is not None:
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def ks_statistics_sorted(real_sorted, synthetic_sorted, n_real, n_synthetic):
+        """
+        KS statistic for each row of two presorted (features x samples) arrays
+        
+        Only the first n_real[k] / n_synthetic[k] entries of row k are used.
+        """
+        n_features = real_sorted.shape[0]
+        statistics = np.empty(n_features)
+        for k in numba.prange(n_features):
+            n1 = n_real[k]
+            n2 = n_synthetic[k]
+            inv_n1 = 1.0 / n1
+            inv_n2 = 1.0 / n2
+            i = 0
+            j = 0
+            max_d = 0.0
+            # Merge walk; ties advance both sides before the CDFs are compared
+            while i < n1 and j < n2:
+                v = min(real_sorted[k, i], synthetic_sorted[k, j])
+                while i < n1 and real_sorted[k, i] <= v:
+                    i += 1
+                while j < n2 and synthetic_sorted[k, j] <= v:
+                    j += 1
+                d = abs(i * inv_n1 - j * inv_n2)
+                if d > max_d:
+                    max_d = d
+            statistics[k] = max_d
+        return statistics
+
+
+def ks_2samp_columns(real, synthetic, n_real=None, n_synthetic=None, real_sorted=None):
+    """
+    Two-sample Kolmogorov-Smirnov test for every column of two 2-D arrays
+    
+    NaNs are ignored per column. P-values use the asymptotic Kolmogorov
+    distribution, as stats.ks_2samp(method='asymp') does.
+    
+    Args:
+        n_real, n_synthetic: Per-column counts of non-NaN values, if already
+            known; computed from the data otherwise
+        real_sorted: np.sort(real, axis=0), if already computed
+    
+    Returns:
+        (statistics, pvalues) arrays with one entry per column
+    """
+    # np.sort places NaNs last, so the first n values of each column are valid
+    if real_sorted is None:
+        real_sorted = np.sort(real, axis=0)
+    synthetic_sorted = np.sort(synthetic, axis=0)
+    if n_real is None:
+        n_real = (~np.isnan(real)).sum(axis=0)
+    if n_synthetic is None:
+        n_synthetic = (~np.isnan(synthetic)).sum(axis=0)
+    
+    if numba is not None and real.size + synthetic.size >= KS_NUMBA_MIN_VALUES:
+        # Feature-major layout keeps each column contiguous for the kernel
+        statistics = ks_statistics_sorted(
+            np.ascontiguousarray(real_sorted.T),
+            np.ascontiguousarray(synthetic_sorted.T),
+            n_real,
+            n_synthetic
+        )
+    else:
+        statistics = np.empty(real.shape[1])
+        for j in range(real.shape[1]):
+            r = real_sorted[:n_real[j], j]
+            s = synthetic_sorted[:n_synthetic[j], j]
+            values = np.concatenate([r, s])
+            cdf_r = np.searchsorted(r, values, side='right') / len(r)
+            cdf_s = np.searchsorted(s, values, side='right') / len(s)
+            statistics[j] = np.max(np.abs(cdf_r - cdf_s))
+    
+    en = np.round(n_real * n_synthetic / (n_real + n_synthetic))
+    pvalues = np.clip(stats.kstwo.sf(statistics, en), 0, 1)
+    return statistics, pvalues
+
+
+def nearest_distances(queries, reference, block_size=1024):
+    """
+    Euclidean distance from each query row to its nearest reference row
+    
+    Uses an exact faiss L2 index when faiss is installed, otherwise float32
+    matrix products over blocks of queries so memory stays bounded.
+    """
+    queries = np.ascontiguousarray(queries, dtype=np.float32)
+    reference = np.ascontiguousarray(reference, dtype=np.float32)
+    
+    if faiss is not None:
+        index = faiss.IndexFlatL2(reference.shape[1])
+        index.add(reference)
+        min_sq, _ = index.search(queries, 1)
+        min_sq = min_sq[:, 0]
+    else:
+        # ||q - r||^2 = ||q||^2 + ||r||^2 - 2 q.r, so each block is one matrix product
+        reference_sq = (reference ** 2).sum(axis=1)
+        min_sq = np.empty(len(queries), dtype=np.float32)
+        for start in range(0, len(queries), block_size):
+            block = queries[start:start + block_size]
+            sq_distances = (block ** 2).sum(axis=1)[:, None] + reference_sq[None, :] - 2 * (block @ reference.T)
+            min_sq[start:start + block_size] = sq_distances.min(axis=1)
+    
+    # Rounding can leave tiny negatives for near-identical points
+    return np.sqrt(np.maximum(min_sq, 0))
+
+
+def nan_corrcoef(X):
+    """
+    Pearson correlation matrix of the columns of X over pairwise-complete rows
+    
+    Gives the same result as DataFrame.corr() on data with NaNs, but is built
+    from a handful of matrix products instead of a per-pair loop.
+    """
+    # Centering keeps the sum-of-products formulas below well conditioned
+    X = X - np.nanmean(X, axis=0)
+    observed = ~np.isnan(X)
+    X[~observed] = 0
+    observed = observed.astype(X.dtype)
+    
+    # Entry [i, j] of each sum is taken over rows where both i and j are observed.
+    # Updates are done in place to keep the number of K x K temporaries low.
+    n = observed.T @ observed
+    sum_x = X.T @ observed
+    
+    cov = X.T @ X
+    cov *= n
+    cov -= sum_x * sum_x.T
+    
+    var = (X * X).T @ observed
+    var *= n
+    del n
+    var -= np.square(sum_x, out=sum_x)
+    del sum_x
+    
+    cov /= np.sqrt(var * var.T)
+    return cov
+
 
 class SyntheticDataEvaluator:
     """Evaluate quality of synthetic data"""
     
-    def __init__(self):
+    def __init__(self, cache_dir='results/cache'):
+        self.cache_dir = Path(cache_dir)
         self.real_data = None
         self.synthetic_data = None
+        self.feature_cols = None
+        self.X_real_np = None
+        self.X_synthetic_np = None
+        self.X_real_std = None
+        self.X_synthetic_std = None
+        self.n_real_observed = None
+        self.n_synthetic_observed = None
+        # Column-sorted real features, kept across statistical_similarity calls
+        self._real_sorted = None
         self.evaluation_results = {}
-        
+        # Per-thread report buffer, set while a metric runs in run_full_evaluation
+        self._output = threading.local()
+        # Whole-run report, written to stdout once at the end of run_full_evaluation
+        self._log = None
+        
+    def report(self, message=""):
+        """Print a report line, or buffer it while an evaluation run is collecting output"""
+        buffer = getattr(self._output, 'buffer', None)
+        if buffer is None:
+            buffer = self._log
+        if buffer is None:
+            print(message)
+        else:
+            buffer.write(message + "\n")
+    
+    def run_buffered(self, metric):
+        """Run a metric method and return its report text instead of printing it"""
+        self._output.buffer = io.StringIO()
+        try:
+            metric()
+            return self._output.buffer.getvalue()
+        finally:
+            self._output.buffer = None
+    
     def load_data(self, real_features_path, real_labels_path, 
                   synthetic_features_path, synthetic_labels_path):
         """Load real and synthetic data"""
         try:
             # Load real data
-            X_real = pd.read_csv(real_features_path)
-            y_real = pd.read_csv(real_labels_path)
-            self.real_data = X_real.copy()
-            self.real_data['target'] = y_real.values
+            X_real = read_table(real_features_path)
+            y_real = read_table(real_labels_path)
+            # read_table returns fresh frames, so the target is attached without a copy
+            self.real_data = X_real
+            self.real_data['target'] = y_real.to_numpy().ravel()
             
             # Load synthetic data
-            X_synthetic = pd.read_csv(synthetic_features_path)
-            y_synthetic = pd.read_csv(synthetic_labels_path)
-            self.synthetic_data = X_synthetic.copy()
-            self.synthetic_data['target'] = y_synthetic.values
+            X_synthetic = read_table(synthetic_features_path)
+            y_synthetic = read_table(synthetic_labels_path)
+            self.synthetic_data = X_synthetic
+            self.synthetic_data['target'] = y_synthetic.to_numpy().ravel()
+            
+            # Feature matrices shared by every metric, converted once. pandas hands
+            # back column-major arrays, so force the row-major float32 layout that
+            # the BLAS, sorting and distance code expect.
+            self.feature_cols = [col for col in self.real_data.columns if col != 'target']
+            self.X_real_np = np.ascontiguousarray(
+                self.real_data[self.feature_cols].to_numpy(np.float32)
+            )
+            self.X_synthetic_np = np.ascontiguousarray(
+                self.synthetic_data[self.feature_cols].to_numpy(np.float32)
+            )
+            
+            # Non-missing values per feature, so metrics need not rescan for NaNs
+            self.n_real_observed = self.real_data[self.feature_cols].count().to_numpy()
+            self.n_synthetic_observed = self.synthetic_data[self.feature_cols].count().to_numpy()
+            self._real_sorted = None
+            
+            # Standardized with real-data statistics for distance calculations;
+            # missing values are placed at the real-data mean, 0 after scaling
+            scaler = StandardScaler().fit(self.X_real_np)
+            self.X_real_std = np.nan_to_num(scaler.transform(self.X_real_np), nan=0.0, copy=False)
+            self.X_synthetic_std = np.nan_to_num(scaler.transform(self.X_synthetic_np), nan=0.0, copy=False)
             
             print(f"✓ Loaded data for evaluation")
             print(f"  Real: {self.real_data.shape}")
@@ -53,37 +271,38 @@ class SyntheticDataEvaluator:
         Test statistical similarity between real and synthetic data
         Uses Kolmogorov-Smirnov test
         """
-        print("\n" + "="*60)
-        print("1. Statistical Similarity Tests")
-        print("="*60)
+        self.report("\n" + "="*60)
+        self.report("1. Statistical Similarity Tests")
+        self.report("="*60)
         
         results = {}
-        feature_cols = [col for col in self.real_data.columns if col != 'target']
-        
-        ks_pvalues = []
-        similar_features = 0
+        n_features = len(self.feature_cols)
+        
+        # Real columns are sorted once; repeat calls only sort the synthetic side
+        if self._real_sorted is None:
+            self._real_sorted = np.sort(self.X_real_np, axis=0)
+        
+        # KS test on all features at once
+        _, ks_pvalues = ks_2samp_columns(
+            self.X_real_np,
+            self.X_synthetic_np,
+            self.n_real_observed,
+            self.n_synthetic_observed,
+            real_sorted=self._real_sorted
+        )
         
-        for col in feature_cols:
-            # KS test
-            ks_stat, ks_pval = stats.ks_2samp(
-                self.real_data[col].dropna(),
-                self.synthetic_data[col].dropna()
-            )
-            ks_pvalues.append(ks_pval)
-            
-            # Consider similar if p > 0.05
-            if ks_pval > 0.05:
-                similar_features += 1
+        # Consider similar if p > 0.05
+        similar_features = int((ks_pvalues > 0.05).sum())
         
-        results['ks_pvalues'] = ks_pvalues
+        results['ks_pvalues'] = ks_pvalues.tolist()
         results['mean_ks_pvalue'] = np.mean(ks_pvalues)
         results['median_ks_pvalue'] = np.median(ks_pvalues)
-        results['pct_similar_features'] = (similar_features / len(feature_cols)) * 100
+        results['pct_similar_features'] = (similar_features / n_features) * 100
         
-        print(f"Kolmogorov-Smirnov Test:")
-        print(f"  Mean p-value: {results['mean_ks_pvalue']:.4f}")
-        print(f"  Median p-value: {results['median_ks_pvalue']:.4f}")
-        print(f"  Features statistically similar (p>0.05): {similar_features}/{len(feature_cols)} ({results['pct_similar_features']:.1f}%)")
+        self.report(f"Kolmogorov-Smirnov Test:")
+        self.report(f"  Mean p-value: {results['mean_ks_pvalue']:.4f}")
+        self.report(f"  Median p-value: {results['median_ks_pvalue']:.4f}")
+        self.report(f"  Features statistically similar (p>0.05): {similar_features}/{n_features} ({results['pct_similar_features']:.1f}%)")
         
         self.evaluation_results['statistical_similarity'] = results
         return results
@@ -92,19 +311,18 @@ class SyntheticDataEvaluator:
         """
         Test if correlation structure is preserved
         """
-        print("\n" + "="*60)
-        print("2. Correlation Structure Preservation")
-        print("="*60)
-        
-        feature_cols = [col for col in self.real_data.columns if col != 'target']
+        self.report("\n" + "="*60)
+        self.report("2. Correlation Structure Preservation")
+        self.report("="*60)
         
         # Calculate correlation matrices
-        real_corr = self.real_data[feature_cols].corr()
-        synthetic_corr = self.synthetic_data[feature_cols].corr()
+        real_corr = nan_corrcoef(self.X_real_np)
+        synthetic_corr = nan_corrcoef(self.X_synthetic_np)
         
         # Flatten upper triangles
-        real_corr_flat = real_corr.values[np.triu_indices_from(real_corr.values, k=1)]
-        synthetic_corr_flat = synthetic_corr.values[np.triu_indices_from(synthetic_corr.values, k=1)]
+        upper = np.triu_indices(len(self.feature_cols), k=1)
+        real_corr_flat = real_corr[upper]
+        synthetic_corr_flat = synthetic_corr[upper]
         
         # Calculate correlation between correlations
         corr_corr = np.corrcoef(real_corr_flat, synthetic_corr_flat)[0, 1]
@@ -117,16 +335,16 @@ class SyntheticDataEvaluator:
             'r_squared': r_squared
         }
         
-        print(f"Correlation between real and synthetic correlation matrices:")
-        print(f"  Correlation: {corr_corr:.4f}")
-        print(f"  R²: {r_squared:.4f}")
+        self.report(f"Correlation between real and synthetic correlation matrices:")
+        self.report(f"  Correlation: {corr_corr:.4f}")
+        self.report(f"  R²: {r_squared:.4f}")
         
         if r_squared > 0.9:
-            print(f"  ✓ Excellent correlation preservation")
+            self.report(f"  ✓ Excellent correlation preservation")
         elif r_squared > 0.7:
-            print(f"  ✓ Good correlation preservation")
+            self.report(f"  ✓ Good correlation preservation")
         else:
-            print(f"  ⚠ Moderate correlation preservation")
+            self.report(f"  ⚠ Moderate correlation preservation")
         
         self.evaluation_results['correlation_preservation'] = results
         return results
@@ -137,33 +355,18 @@ class SyntheticDataEvaluator:
         - Distance to Closest Record (DCR)
         - Nearest neighbor distance ratio
         """
-        print("\n" + "="*60)
-        print("3. Privacy Preservation Metrics")
-        print("="*60)
-        
-        feature_cols = [col for col in self.real_data.columns if col != 'target']
-        
-        # Standardize data for distance calculations
-        scaler = StandardScaler()
-        real_scaled = scaler.fit_transform(self.real_data[feature_cols])
-        synthetic_scaled = scaler.transform(self.synthetic_data[feature_cols])
-        
-        # Calculate DCR for sample of synthetic records (computationally expensive for all)
-        sample_size = min(100, len(self.synthetic_data))
-        sample_indices = np.random.choice(len(self.synthetic_data), sample_size, replace=False)
+        self.report("\n" + "="*60)
+        self.report("3. Privacy Preservation Metrics")
+        self.report("="*60)
         
-        dcr_values = []
-        for idx in sample_indices:
-            synthetic_point = synthetic_scaled[idx]
-            # Calculate distances to all real points
-            distances = np.linalg.norm(real_scaled - synthetic_point, axis=1)
-            min_distance = np.min(distances)
-            dcr_values.append(min_distance)
+        # Calculate DCR for every synthetic record, on the data standardized
+        # once in load_data
+        dcr_values = nearest_distances(self.X_synthetic_std, self.X_real_std)
         
         # Calculate statistics
-        mean_dcr = np.mean(dcr_values)
-        std_dcr = np.std(dcr_values)
-        min_dcr = np.min(dcr_values)
+        mean_dcr = float(np.mean(dcr_values))
+        std_dcr = float(np.std(dcr_values))
+        min_dcr = float(np.min(dcr_values))
         
         results = {
             'mean_dcr': mean_dcr,
@@ -172,37 +375,84 @@ class SyntheticDataEvaluator:
             'mean_dcr_in_std_units': mean_dcr  # Already in standardized units
         }
         
-        print(f"Distance to Closest Record (DCR):")
-        print(f"  Mean: {mean_dcr:.4f} std units")
-        print(f"  Std Dev: {std_dcr:.4f}")
-        print(f"  Min: {min_dcr:.4f}")
+        self.report(f"Distance to Closest Record (DCR):")
+        self.report(f"  Mean: {mean_dcr:.4f} std units")
+        self.report(f"  Std Dev: {std_dcr:.4f}")
+        self.report(f"  Min: {min_dcr:.4f}")
         
         if mean_dcr > 2.0:
-            print(f"  ✓ Excellent privacy - synthetic records are distant from real records")
+            self.report(f"  ✓ Excellent privacy - synthetic records are distant from real records")
         elif mean_dcr > 1.0:
-            print(f"  ✓ Good privacy preservation")
+            self.report(f"  ✓ Good privacy preservation")
         else:
-            print(f"  ⚠ Some synthetic records may be too close to real records")
+            self.report(f"  ⚠ Some synthetic records may be too close to real records")
         
         self.evaluation_results['privacy_metrics'] = results
         return results
     
+    def build_classifier(self):
+        """
+        Classifier used for both ML efficacy scenarios
+        
+        Early stopping on a 10% validation split ends boosting once the loss
+        stops improving, so typically far fewer than max_iter trees are built.
+        """
+        return HistGradientBoostingClassifier(
+            max_iter=200,
+            early_stopping=True,
+            validation_fraction=0.1,
+            n_iter_no_change=10,
+            random_state=42
+        )
+    
+    def fit_baseline_model(self, X_train, y_train):
+        """
+        Fit the real-data baseline model, reusing a cached fit when available
+        
+        The fit is deterministic for a given training set, so it is stored on
+        disk keyed by a hash of the training data, model parameters and
+        scikit-learn version. An unreadable cache file is refitted and replaced.
+        """
+        model = self.build_classifier()
+        
+        key = hashlib.blake2b(digest_size=8)
+        key.update(np.ascontiguousarray(X_train).tobytes())
+        key.update(np.ascontiguousarray(y_train).tobytes())
+        key.update(repr(sorted(model.get_params().items())).encode())
+        key.update(sklearn.__version__.encode())
+        cache_path = self.cache_dir / f'baseline_{key.hexdigest()}.joblib'
+        
+        if cache_path.exists():
+            try:
+                cached_model = joblib.load(cache_path)
+            except Exception as e:
+                self.report(f"  Ignoring unreadable cached baseline model {cache_path}: {e}")
+            else:
+                self.report(f"  Using cached baseline model: {cache_path}")
+                return cached_model
+        
+        model.fit(X_train, y_train)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so an interrupted run cannot leave a truncated cache file
+        tmp_path = cache_path.with_suffix('.tmp')
+        joblib.dump(model, tmp_path)
+        tmp_path.replace(cache_path)
+        return model
+    
     def ml_efficacy(self):
         """
         Test ML efficacy - can models trained on synthetic data perform well?
         """
-        print("\n" + "="*60)
-        print("4. Machine Learning Efficacy")
-        print("="*60)
-        
-        feature_cols = [col for col in self.real_data.columns if col != 'target']
+        self.report("\n" + "="*60)
+        self.report("4. Machine Learning Efficacy")
+        self.report("="*60)
         
         # Prepare data
-        X_real = self.real_data[feature_cols]
-        y_real = self.real_data['target']
+        X_real = self.X_real_np
+        y_real = self.real_data['target'].to_numpy()
         
-        X_synthetic = self.synthetic_data[feature_cols]
-        y_synthetic = self.synthetic_data['target']
+        X_synthetic = self.X_synthetic_np
+        y_synthetic = self.synthetic_data['target'].to_numpy()
         
         # Split real data for testing
         X_train_real, X_test_real, y_train_real, y_test_real = train_test_split(
@@ -210,9 +460,8 @@ class SyntheticDataEvaluator:
         )
         
         # Model 1: Trained on real data, tested on real data (baseline)
-        print("\nScenario 1: Train on Real → Test on Real (Baseline)")
-        model_real = RandomForestClassifier(n_estimators=100, random_state=42, n_jobs=-1)
-        model_real.fit(X_train_real, y_train_real)
+        self.report("\nScenario 1: Train on Real → Test on Real (Baseline)")
+        model_real = self.fit_baseline_model(X_train_real, y_train_real)
         
         y_pred_real = model_real.predict(X_test_real)
         f1_real_real = f1_score(y_test_real, y_pred_real, average='weighted')
@@ -222,13 +471,13 @@ class SyntheticDataEvaluator:
         except:
             auc_real_real = None
         
-        print(f"  F1-Score: {f1_real_real:.4f}")
+        self.report(f"  F1-Score: {f1_real_real:.4f}")
         if auc_real_real:
-            print(f"  AUC-ROC: {auc_real_real:.4f}")
+            self.report(f"  AUC-ROC: {auc_real_real:.4f}")
         
         # Model 2: Trained on synthetic data, tested on real data
-        print("\nScenario 2: Train on Synthetic → Test on Real (Key Test)")
-        model_synthetic = RandomForestClassifier(n_estimators=100, random_state=42, n_jobs=-1)
+        self.report("\nScenario 2: Train on Synthetic → Test on Real (Key Test)")
+        model_synthetic = self.build_classifier()
         model_synthetic.fit(X_synthetic, y_synthetic)
         
         y_pred_synthetic = model_synthetic.predict(X_test_real)
@@ -239,23 +488,23 @@ class SyntheticDataEvaluator:
         except:
             auc_synthetic_real = None
         
-        print(f"  F1-Score: {f1_synthetic_real:.4f}")
+        self.report(f"  F1-Score: {f1_synthetic_real:.4f}")
         if auc_synthetic_real:
-            print(f"  AUC-ROC: {auc_synthetic_real:.4f}")
+            self.report(f"  AUC-ROC: {auc_synthetic_real:.4f}")
         
         # Calculate performance retention
         f1_retention = (f1_synthetic_real / f1_real_real) * 100
         
-        print(f"\nPerformance Retention: {f1_retention:.1f}%")
+        self.report(f"\nPerformance Retention: {f1_retention:.1f}%")
         
         if f1_retention > 95:
-            print(f"  ✓ Excellent - synthetic data nearly matches real data")
+            self.report(f"  ✓ Excellent - synthetic data nearly matches real data")
         elif f1_retention > 85:
-            print(f"  ✓ Good - synthetic data maintains strong predictive value")
+            self.report(f"  ✓ Good - synthetic data maintains strong predictive value")
         elif f1_retention > 70:
-            print(f"  ⚠ Acceptable - some degradation in performance")
+            self.report(f"  ⚠ Acceptable - some degradation in performance")
         else:
-            print(f"  ✗ Poor - significant performance loss")
+            self.report(f"  ✗ Poor - significant performance loss")
         
         results = {
             'f1_real_real': f1_real_real,
@@ -270,20 +519,43 @@ class SyntheticDataEvaluator:
     
     def run_full_evaluation(self):
         """Run all evaluation metrics"""
-        print("\n" + "="*70)
-        print("COMPREHENSIVE SYNTHETIC DATA QUALITY EVALUATION")
-        print("="*70)
+        # The report is collected here and written in a single call at the end
+        self._log = io.StringIO()
+        try:
+            self._evaluate_all()
+        finally:
+            sys.stdout.write(self._log.getvalue())
+            sys.stdout.flush()
+            self._log = None
         
-        # Run all tests
-        self.statistical_similarity()
-        self.correlation_preservation()
-        self.privacy_metrics()
-        self.ml_efficacy()
+        return self.evaluation_results
+    
+    def _evaluate_all(self):
+        """Run the metrics and the overall assessment, reporting into self._log"""
+        self.report("\n" + "="*70)
+        self.report("COMPREHENSIVE SYNTHETIC DATA QUALITY EVALUATION")
+        self.report("="*70)
+        
+        # Run all tests concurrently; NumPy, SciPy and scikit-learn release the
+        # GIL in their heavy loops, so wall time approaches the slowest phase.
+        # The KS tests stay on this thread: numba's default workqueue threading
+        # layer must not be launched from worker threads.
+        background_metrics = [
+            self.correlation_preservation,
+            self.privacy_metrics,
+            self.ml_efficacy
+        ]
+        with ThreadPoolExecutor(max_workers=len(background_metrics)) as executor:
+            futures = [executor.submit(self.run_buffered, metric) for metric in background_metrics]
+            self._log.write(self.run_buffered(self.statistical_similarity))
+            # Reports are appended in the usual order as each phase completes
+            for future in futures:
+                self._log.write(future.result())
         
         # Overall assessment
-        print("\n" + "="*70)
-        print("OVERALL ASSESSMENT")
-        print("="*70)
+        self.report("\n" + "="*70)
+        self.report("OVERALL ASSESSMENT")
+        self.report("="*70)
         
         # Calculate overall score
         scores = []
@@ -321,17 +593,20 @@ class SyntheticDataEvaluator:
             scores.append(('ML Efficacy', '⚠ Acceptable', ml_eff))
         
         for metric, assessment, value in scores:
-            print(f"{metric:.<30} {assessment}")
-        
-        return self.evaluation_results
+            self.report(f"{metric:.<30} {assessment}")
     
     def save_results(self, output_path='results/metrics/evaluation_results.json'):
         """Save evaluation results to JSON"""
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, 'w') as f:
-            json.dump(self.evaluation_results, f, indent=2)
+        # orjson writes NaN/inf (e.g. r_squared for a constant feature) as null;
+        # app.py displays those as n/a
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(
+                self.evaluation_results,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            ))
         
         print(f"\n✓ Evaluation results saved to {output_path}")
 
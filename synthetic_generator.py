@@ -8,8 +8,12 @@ import numpy as np
 from pathlib import Path
 from sdv.single_table import GaussianCopulaSynthesizer, CTGANSynthesizer
 from sdv.metadata import SingleTableMetadata
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 import pickle
 import time
+from table_io import read_table
+
 
 class SyntheticDataGenerator:
     """Generate synthetic data using various methods"""
@@ -28,8 +32,8 @@ class SyntheticDataGenerator:
                        labels_path='data/raw/secom_labels_clean.csv'):
         """Load cleaned real data"""
         try:
-            X = pd.read_csv(features_path)
-            y = pd.read_csv(labels_path)
+            X = read_table(features_path)
+            y = read_table(labels_path)
             
             # Combine features and labels
             self.real_data = X.copy()
@@ -172,12 +176,16 @@ class SyntheticDataGenerator:
             X_path = self.synthetic_dir / f'features_{filename}'
             y_path = self.synthetic_dir / f'labels_{filename}'
             
-            X_synthetic.to_csv(X_path, index=False)
-            y_synthetic.to_csv(y_path, index=False)
+            X_synthetic.to_parquet(X_path.with_suffix('.parquet'), engine='pyarrow', compression='snappy')
+            y_synthetic.to_frame().to_parquet(y_path.with_suffix('.parquet'), engine='pyarrow', compression='snappy')
+            
+            # CSV copies for external tools; pyarrow's writer is multi-threaded
+            pa_csv.write_csv(pa.Table.from_pandas(X_synthetic, preserve_index=False), X_path)
+            pa_csv.write_csv(pa.Table.from_pandas(y_synthetic.to_frame(), preserve_index=False), y_path)
             
             print(f"✓ Saved synthetic data:")
-            print(f"  - Features: {X_path}")
-            print(f"  - Labels: {y_path}")
+            print(f"  - Features: {X_path.with_suffix('.parquet')}")
+            print(f"  - Labels: {y_path.with_suffix('.parquet')}")
             
             # Save synthesizer
             model_path = self.synthetic_dir / f'synthesizer_{filename.replace(".csv", ".pkl")}'
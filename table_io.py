@@ -0,0 +1,17 @@
+"""
+Table I/O shared by the generator, evaluator and dashboard
+Reads Parquet when available and falls back to the CSV copy
+"""
+
+import pandas as pd
+from pathlib import Path
+
+
+def read_table(path, dtype=None, columns=None):
+    """Read a Parquet table, falling back to the CSV file with the same stem"""
+    path = Path(path)
+    try:
+        df = pd.read_parquet(path.with_suffix('.parquet'), engine='pyarrow', columns=columns)
+    except FileNotFoundError:
+        return pd.read_csv(path.with_suffix('.csv'), engine='pyarrow', dtype=dtype, usecols=columns)
+    return df if dtype is None else df.astype(dtype, copy=False)